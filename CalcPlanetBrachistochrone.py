@@ -7,12 +7,15 @@ under different acceleration scenarios.
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from itertools import combinations
 from typing import Dict, List, Tuple
-import csv
+import io
 import math
 import os
 
+import numpy as np
+
 def days_to_dhm(days: float) -> str:
     """Convert decimal days to days and hours string."""
     total_hours = days * 24
@@ -20,6 +23,13 @@ def days_to_dhm(days: float) -> str:
     h = int(total_hours % 24)
     return f"{d}d {h}h"
 
+def days_to_dhm_array(days: np.ndarray) -> List[str]:
+    """Convert an array of decimal days to days and hours strings."""
+    total_hours = np.asarray(days) * 24
+    d = (total_hours // 24).astype(int)
+    h = (total_hours % 24).astype(int)
+    return [f"{di}d {hi}h" for di, hi in zip(d.tolist(), h.tolist())]
+
 # Physical constants
 @dataclass(frozen=True)
 class Constants:
@@ -30,7 +40,7 @@ class Constants:
     C: float = 299792.458  # Speed of light in km/s
 
 # Planetary orbital parameters
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Planet:
     perihelion: float  # AU
     aphelion: float  # AU
@@ -47,7 +57,29 @@ PLANETS: Dict[str, Planet] = {
     'Neptune': Planet(29.767, 30.441)
 }
 
-@dataclass
+# Solar system order, plus the orbital parameters laid out as parallel arrays
+# indexed by position in that order for the vectorized paths
+PLANET_ORDER = ['Mercury', 'Venus', 'Earth', 'Mars', 'Ceres', 'Jupiter', 'Saturn', 'Uranus', 'Neptune']
+_NAMES = np.array(PLANET_ORDER)
+_PERI = np.array([PLANETS[name].perihelion for name in PLANET_ORDER])
+_APH = np.array([PLANETS[name].aphelion for name in PLANET_ORDER])
+
+# Route CSV columns, and the decimals each is exported with; None marks the
+# names and the orbital inputs, which are written exactly via %s (shortest repr)
+ROUTE_HEADERS = [
+    'origin_planet', 'destination_planet',
+    'min_time_days_1_3g', 'max_time_days_1_3g', 'median_time_days_1_3g',
+    'min_time_days_1g', 'max_time_days_1g', 'median_time_days_1g',
+    'min_distance_au', 'max_distance_au',
+    'min_distance_km', 'max_distance_km',
+    'min_deltav_kms_1_3g', 'max_deltav_kms_1_3g',
+    'min_deltav_kms_1g', 'max_deltav_kms_1g',
+    'origin_perihelion_au', 'origin_aphelion_au',
+    'destination_perihelion_au', 'destination_aphelion_au'
+]
+_ROUTE_DECIMALS = [None] * 2 + [3] * 6 + [6] * 2 + [0] * 2 + [2] * 4 + [None] * 4
+
+@dataclass(slots=True)
 class TravelMetrics:
     """Container for travel calculation results."""
     min_distance: float  # AU
@@ -58,6 +90,92 @@ class TravelMetrics:
     min_delta_v: float  # km/s for minimum distance
     max_delta_v: float  # km/s for maximum distance
 
+@dataclass(slots=True)
+class TravelMetricsBatch:
+    """Container for vectorized results over N planet pairs and A accelerations."""
+    min_distance: np.ndarray  # AU, shape (N,)
+    max_distance: np.ndarray  # AU, shape (N,)
+    min_time: np.ndarray  # days, shape (A, N)
+    max_time: np.ndarray  # days, shape (A, N)
+    median_time: np.ndarray  # days, shape (A, N)
+    min_delta_v: np.ndarray  # km/s for minimum distance, shape (A, N)
+    max_delta_v: np.ndarray  # km/s for maximum distance, shape (A, N)
+
+# Scalar kernels. These take plain floats rather than Planet/Constants
+# instances so they can be called directly from parameter sweeps.
+#
+# Keep these on math, not numpy: on a single float math.sqrt is several
+# times faster than np.sqrt, which pays ufunc dispatch on every call. Array
+# work belongs in calculate_metrics_batch, which uses np throughout.
+def brachistochrone_time(distance_km: float, acceleration_kms2: float) -> float:
+    """Calculate brachistochrone time for given distance and acceleration."""
+    return 2 * math.sqrt(distance_km / acceleration_kms2)
+
+# Brachistochrone time is linear in sqrt(distance): t = factor * sqrt(AU),
+# with factor = 2 * sqrt(AU_TO_KM / acceleration) in seconds per sqrt(AU)
+def brachistochrone_time_au(distance_au: float, factor: float) -> float:
+    """Calculate brachistochrone time from an AU distance and a precomputed factor."""
+    return factor * math.sqrt(distance_au)
+
+def max_velocity(time_seconds: float, acceleration_kms2: float) -> float:
+    """Calculate maximum velocity achieved at midpoint."""
+    return acceleration_kms2 * (time_seconds / 2)
+
+def total_deltav(peak_velocity: float) -> float:
+    """Calculate total delta-v required for the mission."""
+    return 2 * peak_velocity
+
+def orbital_distances(peri1: float, aph1: float,
+                      peri2: float, aph2: float) -> Tuple[float, float]:
+    """Calculate minimum and maximum possible distances between two orbits (AU)."""
+    min_dist = max(0.0, max(peri1, peri2) - min(aph1, aph2))
+    max_dist = aph1 + aph2
+    return (min_dist, max_dist)
+
+def median_distance(peri1: float, aph1: float, peri2: float, aph2: float) -> float:
+    """Calculate median distance between two orbits (AU)."""
+    r1 = (peri1 + aph1) / 2
+    r2 = (peri2 + aph2) / 2
+    
+    if abs(r1 - 1) < 0.1:  # If origin is Earth's orbit
+        return math.sqrt(1 + r2 * r2)
+    else:
+        m1 = math.sqrt(1 + r1 * r1)
+        m2 = math.sqrt(1 + r2 * r2)
+        return abs(m2 - m1)
+
+def _metrics_from_distances(min_dist: float, max_dist: float, median_dist: float,
+                            acceleration: float, factor: float) -> Tuple[float, ...]:
+    """Calculate raw travel metrics from orbital distances (AU) as a 7-tuple.
+
+    factor is 2 * sqrt(AU_TO_KM / acceleration), see brachistochrone_time_au.
+    """
+    min_time = brachistochrone_time_au(min_dist, factor)
+    max_time = brachistochrone_time_au(max_dist, factor)
+    median_time = brachistochrone_time_au(median_dist, factor)
+    
+    return (
+        min_dist,
+        max_dist,
+        min_time / 86400,  # Convert to days
+        max_time / 86400,
+        median_time / 86400,
+        total_deltav(max_velocity(min_time, acceleration)),
+        total_deltav(max_velocity(max_time, acceleration))
+    )
+
+# Planet is frozen and therefore hashable, so pair geometry can be cached
+# across the repeated traversals done by the output writers.
+@lru_cache(maxsize=256)
+def get_orbital_distances(p1: Planet, p2: Planet) -> Tuple[float, float]:
+    """Calculate minimum and maximum possible distances between two planetary orbits."""
+    return orbital_distances(p1.perihelion, p1.aphelion, p2.perihelion, p2.aphelion)
+
+@lru_cache(maxsize=256)
+def calculate_median_distance(p1: Planet, p2: Planet) -> float:
+    """Calculate median distance between two planetary orbits."""
+    return median_distance(p1.perihelion, p1.aphelion, p2.perihelion, p2.aphelion)
+
 class BrachistochroneCalculator:
     """Handles calculations for brachistochrone trajectories between planets."""
     
@@ -66,92 +184,89 @@ class BrachistochroneCalculator:
 
     def calculate_brachistochrone_time(self, distance_km: float, acceleration_kms2: float) -> float:
         """Calculate brachistochrone time for given distance and acceleration."""
-        return 2 * math.sqrt(distance_km / acceleration_kms2)
+        return brachistochrone_time(distance_km, acceleration_kms2)
+
+    def calculate_brachistochrone_time_au(self, distance_au: float, factor: float) -> float:
+        """Calculate brachistochrone time for an AU distance, see brachistochrone_time_au."""
+        return brachistochrone_time_au(distance_au, factor)
 
     def calculate_max_velocity(self, time_seconds: float, acceleration_kms2: float) -> float:
         """Calculate maximum velocity achieved at midpoint."""
-        return acceleration_kms2 * (time_seconds / 2)
+        return max_velocity(time_seconds, acceleration_kms2)
 
     def calculate_total_deltav(self, max_velocity: float) -> float:
         """Calculate total delta-v required for the mission."""
-        return 2 * max_velocity
+        return total_deltav(max_velocity)
 
     def get_orbital_distances(self, p1: Planet, p2: Planet) -> Tuple[float, float]:
         """Calculate minimum and maximum possible distances between two planetary orbits."""
-        min_dist = max(0, max(p1.perihelion, p2.perihelion) - min(p1.aphelion, p2.aphelion))
-        max_dist = p1.aphelion + p2.aphelion
-        return (min_dist, max_dist)
+        return get_orbital_distances(p1, p2)
 
     def calculate_median_distance(self, p1: Planet, p2: Planet) -> float:
         """Calculate median distance between two planetary orbits."""
-        r1 = (p1.perihelion + p1.aphelion) / 2
-        r2 = (p2.perihelion + p2.aphelion) / 2
-        
-        if abs(r1 - 1) < 0.1:  # If origin is Earth's orbit
-            return math.sqrt(1 + r2 * r2)
-        else:
-            m1 = math.sqrt(1 + r1 * r1)
-            m2 = math.sqrt(1 + r2 * r2)
-            return abs(m2 - m1)
-
-    def calculate_metrics(self, origin: Planet, destination: Planet,
-                         acceleration: float) -> TravelMetrics:
-        """Calculate complete travel metrics between two planets."""
-        min_dist, max_dist = self.get_orbital_distances(origin, destination)
-        min_dist_km = min_dist * self.constants.AU_TO_KM
-        max_dist_km = max_dist * self.constants.AU_TO_KM
-        
-        min_time = self.calculate_brachistochrone_time(min_dist_km, acceleration)
-        max_time = self.calculate_brachistochrone_time(max_dist_km, acceleration)
-        
-        median_dist = self.calculate_median_distance(origin, destination)
-        median_time = self.calculate_brachistochrone_time(
-            median_dist * self.constants.AU_TO_KM, acceleration)
-        
-        min_velocity = self.calculate_max_velocity(min_time, acceleration)
-        max_velocity = self.calculate_max_velocity(max_time, acceleration)
-        
-        return TravelMetrics(
+        return calculate_median_distance(p1, p2)
+
+    def calculate_metrics_scalar(self, origin: Planet, destination: Planet,
+                                 acceleration: float) -> TravelMetrics:
+        """Calculate complete travel metrics between two planets using scalar math."""
+        return self.calculate_metrics_multi(origin, destination, (acceleration,))[0]
+
+    calculate_metrics = calculate_metrics_scalar
+
+    def calculate_metrics_multi(self, origin: Planet, destination: Planet,
+                                accelerations: Tuple[float, ...]) -> Tuple[TravelMetrics, ...]:
+        """Calculate travel metrics for several accelerations, sharing the orbital geometry."""
+        min_dist, max_dist = get_orbital_distances(origin, destination)
+        median_dist = calculate_median_distance(origin, destination)
+        factors = [2 * math.sqrt(self.constants.AU_TO_KM / acceleration)
+                   for acceleration in accelerations]
+        return tuple(
+            TravelMetrics(*_metrics_from_distances(
+                min_dist, max_dist, median_dist, acceleration, factor))
+            for acceleration, factor in zip(accelerations, factors)
+        )
+
+    def calculate_metrics_batch(self, perihelia_1: np.ndarray, aphelia_1: np.ndarray,
+                                perihelia_2: np.ndarray, aphelia_2: np.ndarray,
+                                accelerations: np.ndarray) -> TravelMetricsBatch:
+        """Calculate travel metrics for many planet pairs in one vectorized pass.
+
+        Kept separate from calculate_metrics_scalar on purpose: this path is
+        NumPy-only and the scalar path is math-only, see the kernel notes.
+
+        Accelerations broadcast against the pair axis, so passing them as an
+        (A, 1) column yields (A, N) arrays for times and delta-v, while the
+        distances stay (N,).
+        """
+        min_dist = np.maximum(0, np.maximum(perihelia_1, perihelia_2)
+                              - np.minimum(aphelia_1, aphelia_2))
+        max_dist = aphelia_1 + aphelia_2
+
+        r1 = (perihelia_1 + aphelia_1) / 2
+        r2 = (perihelia_2 + aphelia_2) / 2
+        m1 = np.sqrt(1 + r1 * r1)
+        m2 = np.sqrt(1 + r2 * r2)
+        median_dist = np.where(np.abs(r1 - 1) < 0.1, m2, np.abs(m2 - m1))
+
+        factors = 2 * np.sqrt(self.constants.AU_TO_KM / accelerations)
+        min_time = factors * np.sqrt(min_dist)
+        max_time = factors * np.sqrt(max_dist)
+        median_time = factors * np.sqrt(median_dist)
+
+        # Total delta-v is twice the midpoint velocity a * t / 2, i.e. a * t
+        return TravelMetricsBatch(
             min_distance=min_dist,
             max_distance=max_dist,
             min_time=min_time / 86400,  # Convert to days
             max_time=max_time / 86400,
             median_time=median_time / 86400,
-            min_delta_v=self.calculate_total_deltav(min_velocity),
-            max_delta_v=self.calculate_total_deltav(max_velocity)
+            min_delta_v=accelerations * min_time,
+            max_delta_v=accelerations * max_time
         )
 
 class DataFormatter:
     """Handles data formatting and file output."""
     
-    @staticmethod
-    def generate_csv_row(origin_name: str, dest_name: str, 
-                        metrics_1g: TravelMetrics, metrics_1_3g: TravelMetrics,
-                        origin: Planet, destination: Planet) -> List:
-        """Generate a single CSV row."""
-        return [
-            origin_name,
-            dest_name,
-            round(metrics_1g.min_distance, 6),
-            round(metrics_1g.max_distance, 6),
-            round(metrics_1g.min_distance * Constants.AU_TO_KM, 0),
-            round(metrics_1g.max_distance * Constants.AU_TO_KM, 0),
-            round(metrics_1g.min_time, 3),
-            round(metrics_1g.max_time, 3),
-            round(metrics_1g.median_time, 3),
-            round(metrics_1g.min_delta_v, 2),
-            round(metrics_1g.max_delta_v, 2),
-            round(metrics_1_3g.min_time, 3),
-            round(metrics_1_3g.max_time, 3),
-            round(metrics_1_3g.median_time, 3),
-            round(metrics_1_3g.min_delta_v, 2),
-            round(metrics_1_3g.max_delta_v, 2),
-            origin.perihelion,
-            origin.aphelion,
-            destination.perihelion,
-            destination.aphelion
-        ]
-
     @staticmethod
     def format_markdown_row(name1: str, name2: str, metrics: TravelMetrics, 
                           max_velocity: float) -> str:
@@ -168,157 +283,167 @@ class DataFormatter:
         
         return f"| {route} | {min_distance} | {max_distance} | {min_time} | {max_time} | {median_time} | {velocity} | {min_delta_v} | {max_delta_v} |"
 
-def generate_travel_matrix(all_routes, planet_order):
-    """Generate a travel time matrix for markdown output."""
-    # Create a dictionary to store min/max travel times between planets
-    travel_times = {}
+def generate_travel_matrix(all_routes, planet_order, min_times=None, max_times=None):
+    """Generate a travel time matrix for markdown output.
+
+    min_times/max_times are the already formatted 1/3g times per route; they
+    are derived from all_routes when not given.
+    """
+    if min_times is None:
+        min_times = days_to_dhm_array(all_routes['min_time_days_1_3g'])
+    if max_times is None:
+        max_times = days_to_dhm_array(all_routes['max_time_days_1_3g'])
+    
+    # Store min/max travel times in an NxN grid indexed by planet order
+    name_to_idx = {name: i for i, name in enumerate(planet_order)}
+    n = len(planet_order)
+    travel_times = [[None] * n for _ in range(n)]
     
     # Process each route
-    for row in all_routes:
-        origin = row[0]
-        destination = row[1]
-        min_time = days_to_dhm(float(row[2]))  # min_time_days_1_3g
-        max_time = days_to_dhm(float(row[3]))  # max_time_days_1_3g
+    for row, min_time, max_time in zip(all_routes, min_times, max_times):
+        i = name_to_idx[row['origin_planet']]
+        j = name_to_idx[row['destination_planet']]
         
-        # Store in dictionary (in both directions)
-        key = f"{origin}_{destination}"
-        travel_times[key] = f"{min_time}-{max_time}"
+        # Store in both directions
+        travel_times[i][j] = travel_times[j][i] = f"{min_time}-{max_time}"
     
     # Generate the matrix header
-    matrix = "*Travel time ranges (min-max)*\n\n"
-    matrix += "| From → To | " + " | ".join(planet_order) + " |\n"
-    matrix += "|-----------|" + "---------|" * len(planet_order) + "\n"
+    matrix_lines = [
+        "*Travel time ranges (min-max)*",
+        "",
+        "| From → To | " + " | ".join(planet_order) + " |",
+        "|-----------|" + "---------|" * len(planet_order)
+    ]
     
-    # Generate each row of the matrix
-    for origin in planet_order:
-        row = f"| **{origin}** |"
-        
-        for destination in planet_order:
-            if origin == destination:
-                row += " - |"
-            else:
-                key = f"{origin}_{destination}"
-                rev_key = f"{destination}_{origin}"
-                
-                # Use the key if it exists, otherwise use reverse key
-                if key in travel_times:
-                    row += f" {travel_times[key]} |"
-                elif rev_key in travel_times:
-                    row += f" {travel_times[rev_key]} |"
-                else:
-                    row += " - |"
-        
-        matrix += row + "\n"
+    # Generate each row of the matrix; the diagonal and missing routes are "-"
+    for origin, cells in zip(planet_order, travel_times):
+        matrix_lines.append(f"| **{origin}** | " + " | ".join(cell or "-" for cell in cells) + " |")
     
-    return matrix
+    return "\n".join(matrix_lines)
 
-def save_to_markdown(data, base_filename='brachistochrone_1_3g'):
+def save_to_markdown(data, base_filename='brachistochrone_1_3g', timestamp=None):
     """Save 1/3g results to markdown file with timestamp, sorted by min delta-v"""
-    if not os.path.exists('exports'):
-        os.makedirs('exports')
+    os.makedirs('exports', exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f'exports/{base_filename}_{timestamp}.md'
     
-    # Define planet order for matrix
-    planet_order = ['Mercury', 'Venus', 'Earth', 'Mars', 'Ceres', 'Jupiter', 'Saturn', 'Uranus', 'Neptune']
+    # Format travel times once; shared by the sorted table and the matrix
+    min_times = days_to_dhm_array(data['min_time_days_1_3g'])
+    max_times = days_to_dhm_array(data['max_time_days_1_3g'])
     
     # Convert data to list of dictionaries for sorting
     formatted_data = []
-    for row in data:
+    for row, min_time, max_time in zip(data, min_times, max_times):
         formatted_data.append({
-            'route': f"{row[0]} -> {row[1]}",
-            'min_time': days_to_dhm(float(row[2])),
-            'max_time': days_to_dhm(float(row[3])),
-            'min_delta_v': float(row[12]),  # min_deltav_kms_1_3g
-            'max_delta_v': float(row[13])   # max_deltav_kms_1_3g
+            'route': f"{row['origin_planet']} -> {row['destination_planet']}",
+            'min_time': min_time,
+            'max_time': max_time,
+            'min_delta_v': float(row['min_deltav_kms_1_3g']),
+            'max_delta_v': float(row['max_deltav_kms_1_3g'])
         })
     
     # Sort by minimum delta-v
     formatted_data.sort(key=lambda x: x['min_delta_v'])
     
-    with open(filename, 'w', encoding='utf-8') as f:  # Add UTF-8 encoding
-        f.write("## Brachistochrone Travel Times (1/3g)\n\n")
-        
+    # Build the whole document, then write it in one call
+    lines = [
+        "## Brachistochrone Travel Times (1/3g)",
+        "",
         # Add travel time matrix
-        f.write("### Travel Time Matrix\n\n")
-        f.write(generate_travel_matrix(data, planet_order))
-        f.write("\n\n")
-        
+        "### Travel Time Matrix",
+        "",
+        generate_travel_matrix(data, PLANET_ORDER, min_times, max_times),
+        "",
+        "",
         # Add sorted routes by delta-v
-        f.write("### Routes Sorted by Delta-V\n\n")
-        f.write("| Route | Min Time | Max Time | Min dv | Max dv |\n")  # Changed Δv to dv
-        f.write("|--------|-----------|-----------|---------|--------|\n")
-        
-        for row in formatted_data:
-            f.write(f"| {row['route']} | {row['min_time']} | {row['max_time']} | {row['min_delta_v']:,.0f} | {row['max_delta_v']:,.0f} |\n")
+        "### Routes Sorted by Delta-V",
+        "",
+        "| Route | Min Time | Max Time | Min dv | Max dv |",  # Changed Δv to dv
+        "|--------|-----------|-----------|---------|--------|"
+    ]
+    lines.extend(
+        f"| {row['route']} | {row['min_time']} | {row['max_time']} | {row['min_delta_v']:,.0f} | {row['max_delta_v']:,.0f} |"
+        for row in formatted_data
+    )
+    
+    # Encode to UTF-8 once and write the bytes directly
+    with open(filename, 'wb') as f:
+        f.write(("\n".join(lines) + "\n").encode('utf-8'))
     
     print(f"Markdown data saved to: {filename}")
 
+def save_to_csv(routes, base_filename='brachistochrone_extended', timestamp=None):
+    """Save the route table to a CSV file with timestamp"""
+    os.makedirs('exports', exist_ok=True)
+    
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f'exports/{base_filename}_{timestamp}.csv'
+    
+    # Format every cell straight to text in memory, then encode and write once
+    csv_formats = ['%s' if decimals is None else f'%.{decimals}f'
+                   for decimals in _ROUTE_DECIMALS]
+    buffer = io.StringIO()
+    np.savetxt(buffer, routes, fmt=','.join(csv_formats),
+               header=','.join(ROUTE_HEADERS), comments='', newline='\r\n')
+    with open(filename, 'wb') as f:
+        f.write(buffer.getvalue().encode('utf-8'))
+    
+    print(f"CSV data saved to: {filename}")
+
 def main():
     """Main execution function."""
     calculator = BrachistochroneCalculator()
     formatter = DataFormatter()
+    # One timestamp for every output file of this run
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Define solar system order for sorting
-    planet_order = ['Mercury', 'Venus', 'Earth', 'Mars', 'Ceres', 'Jupiter', 'Saturn', 'Uranus', 'Neptune']
+    # Generate routes in solar system order as one batch over the upper
+    # triangle of planet pairs; row 0 of each metric is 1/3g, row 1 is 1g
+    origin_idx, dest_idx = np.triu_indices(len(PLANET_ORDER), k=1)
+    accelerations = np.array([[Constants.G_1_3], [Constants.G]])
     
-    # Generate all routes
-    routes = []
-    headers = [
-        'origin_planet', 'destination_planet',
-        'min_time_days_1_3g', 'max_time_days_1_3g', 'median_time_days_1_3g',
-        'min_time_days_1g', 'max_time_days_1g', 'median_time_days_1g',
-        'min_distance_au', 'max_distance_au',
-        'min_distance_km', 'max_distance_km',
-        'min_deltav_kms_1_3g', 'max_deltav_kms_1_3g',
-        'min_deltav_kms_1g', 'max_deltav_kms_1g',
-        'origin_perihelion_au', 'origin_aphelion_au',
-        'destination_perihelion_au', 'destination_aphelion_au'
-    ]
+    metrics = calculator.calculate_metrics_batch(
+        _PERI[origin_idx], _APH[origin_idx],
+        _PERI[dest_idx], _APH[dest_idx], accelerations)
     
-    # Generate routes in solar system order (remove Alpha Centauri section)
-    for origin_idx, name1 in enumerate(planet_order):
-        for name2 in planet_order[origin_idx + 1:]:
-            metrics_1g = calculator.calculate_metrics(
-                PLANETS[name1], PLANETS[name2], Constants.G)
-            metrics_1_3g = calculator.calculate_metrics(
-                PLANETS[name1], PLANETS[name2], Constants.G_1_3)
-            
-            row = [
-                name1, name2,
-                round(metrics_1_3g.min_time, 3),
-                round(metrics_1_3g.max_time, 3),
-                round(metrics_1_3g.median_time, 3),
-                round(metrics_1g.min_time, 3),
-                round(metrics_1g.max_time, 3),
-                round(metrics_1g.median_time, 3),
-                round(metrics_1g.min_distance, 6),
-                round(metrics_1g.max_distance, 6),
-                round(metrics_1g.min_distance * Constants.AU_TO_KM, 0),
-                round(metrics_1g.max_distance * Constants.AU_TO_KM, 0),
-                round(metrics_1_3g.min_delta_v, 2),
-                round(metrics_1_3g.max_delta_v, 2),
-                round(metrics_1g.min_delta_v, 2),
-                round(metrics_1g.max_delta_v, 2),
-                PLANETS[name1].perihelion,
-                PLANETS[name1].aphelion,
-                PLANETS[name2].perihelion,
-                PLANETS[name2].aphelion
-            ]
-            routes.append(row)
+    # Size the name fields from the data so long body names are not truncated
+    name_dtype = f'U{max(map(len, PLANET_ORDER))}'
+    routes = np.empty(len(origin_idx), dtype=[(name, name_dtype) for name in ROUTE_HEADERS[:2]]
+                      + [(name, 'f8') for name in ROUTE_HEADERS[2:]])
+    routes['origin_planet'] = _NAMES[origin_idx]
+    routes['destination_planet'] = _NAMES[dest_idx]
+    routes['min_time_days_1_3g'] = metrics.min_time[0]
+    routes['max_time_days_1_3g'] = metrics.max_time[0]
+    routes['median_time_days_1_3g'] = metrics.median_time[0]
+    routes['min_time_days_1g'] = metrics.min_time[1]
+    routes['max_time_days_1g'] = metrics.max_time[1]
+    routes['median_time_days_1g'] = metrics.median_time[1]
+    routes['min_distance_au'] = metrics.min_distance
+    routes['max_distance_au'] = metrics.max_distance
+    routes['min_distance_km'] = metrics.min_distance * Constants.AU_TO_KM
+    routes['max_distance_km'] = metrics.max_distance * Constants.AU_TO_KM
+    routes['min_deltav_kms_1_3g'] = metrics.min_delta_v[0]
+    routes['max_deltav_kms_1_3g'] = metrics.max_delta_v[0]
+    routes['min_deltav_kms_1g'] = metrics.min_delta_v[1]
+    routes['max_deltav_kms_1g'] = metrics.max_delta_v[1]
+    routes['origin_perihelion_au'] = _PERI[origin_idx]
+    routes['origin_aphelion_au'] = _APH[origin_idx]
+    routes['destination_perihelion_au'] = _PERI[dest_idx]
+    routes['destination_aphelion_au'] = _APH[dest_idx]
     
-    # Write outputs
-    csv_filename = f"exports/brachistochrone_extended_{timestamp}.csv"
-    with open(csv_filename, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(routes)
+    # Round to the exported precision so the markdown reads the same values
+    # as the CSV written in this run
+    for name, decimals in zip(ROUTE_HEADERS, _ROUTE_DECIMALS):
+        if decimals is not None:
+            routes[name] = np.round(routes[name], decimals)
     
-    print(f"CSV data saved to: {csv_filename}")
+    # Write outputs
+    save_to_csv(routes, timestamp=timestamp)
     print(f"Total routes calculated: {len(routes)}")
-    save_to_markdown(routes)
+    save_to_markdown(routes, timestamp=timestamp)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,45 +2,64 @@
 Relativistic Nauvoo Drive Calculator with Efficiency Analysis
 Calculates performance at different efficiency levels while maintaining thrust
 """
+import bisect
+import io
 import math
 import os
 import csv
 from datetime import datetime
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List
 
+import numpy as np
+
 # Physical constants
 C = 299792458  # Speed of light in m/s
 G = 9.80665    # Standard gravity in m/s²
 LY_TO_M = 9.461e15  # Light years to meters
 DHE3_ENERGY = 3.52e14  # D-He3 fusion energy yield in J/kg
 
-@dataclass
+# Unit conversion reciprocals, so output conversions are multiplications
+_INV_DAY_SECONDS = 1.0 / 86400
+_INV_YEAR_SECONDS = 1.0 / (365.25 * 86400)
+_INV_TON = 1.0e-3
+
+# Cruise velocity (0.119c for Tau Ceti in 100 years) and its Lorentz factor.
+# Both are fixed, so gamma is evaluated once here rather than on every call.
+CRUISE_BETA = 0.119
+CRUISE_GAMMA = 1.0 / math.sqrt(1.0 - CRUISE_BETA * CRUISE_BETA)
+
+@dataclass(frozen=True)
 class DriveParameters:
-    """Parameters for the Epstein Drive"""
+    """Parameters for the Epstein Drive
+
+    dry_mass and efficiency may be NumPy arrays to describe a parameter sweep.
+    Instances are frozen so the cached derived quantities cannot go stale.
+    """
     thrust_per_engine: float  # Newtons
     num_engines: int
     exhaust_velocity: float   # m/s
-    dry_mass: float          # kg
-    efficiency: float        # 0 to 1
+    dry_mass: float | np.ndarray    # kg
+    efficiency: float | np.ndarray  # 0 to 1
 
-    @property
+    @cached_property
     def total_thrust(self) -> float:
         return self.thrust_per_engine * self.num_engines
     
-    @property
+    @cached_property
     def mass_flow_rate(self) -> float:
         return self.total_thrust / self.exhaust_velocity
     
-    @property
+    @cached_property
     def power_per_engine(self) -> float:
         return (self.thrust_per_engine * self.exhaust_velocity) / 2
     
-    @property
+    @cached_property
     def total_power(self) -> float:
         return self.power_per_engine * self.num_engines
     
-    @property
+    @cached_property
     def theoretical_power(self) -> float:
         """Maximum theoretical power from fusion reaction"""
         return self.mass_flow_rate * DHE3_ENERGY
@@ -49,98 +68,116 @@ class DriveParameters:
         """Calculate fuel mass needed for given burn time"""
         return self.mass_flow_rate * burn_time_seconds
 
-def calculate_journey_parameters(drive: DriveParameters, distance_ly: float) -> Dict:
-    """Calculate journey parameters including fuel requirements"""
+def calculate_journey_parameters(drive: DriveParameters,
+                                 distance_ly: float) -> Dict[str, float | np.ndarray]:
+    """Calculate journey parameters including fuel requirements
+
+    For scalar parameters every value is a plain float; for a dry_mass/efficiency
+    sweep every value is a writable array broadcast to the sweep shape.
+    """
+    sweep_shape = np.broadcast(drive.dry_mass, drive.efficiency).shape
     distance = distance_ly * LY_TO_M
+    total_thrust = drive.total_thrust
+    mass_flow = drive.mass_flow_rate
     
     # Calculate acceleration
-    initial_acceleration = drive.total_thrust / (drive.dry_mass + drive.calculate_fuel_mass(3600))  # Use 1 hour of fuel for initial mass
+    initial_acceleration = total_thrust / (drive.dry_mass + mass_flow * 3600)  # Use 1 hour of fuel for initial mass
     
-    # Calculate time needed to reach cruise velocity (0.119c for Tau Ceti in 100 years)
-    target_velocity = 0.119 * C
+    # Calculate time needed to reach cruise velocity
+    target_velocity = CRUISE_BETA * C
     time_to_velocity = target_velocity / initial_acceleration
     
     # Calculate fuel needed for acceleration and deceleration
-    fuel_for_accel = drive.calculate_fuel_mass(time_to_velocity)
+    fuel_for_accel = mass_flow * time_to_velocity
     total_fuel_mass = 2 * fuel_for_accel  # Double for deceleration
     
     # Calculate mass ratio
     mass_ratio = (drive.dry_mass + total_fuel_mass) / drive.dry_mass
     
-    # Calculate relativistic factors
-    gamma = 1 / math.sqrt(1 - (target_velocity/C)**2)
-    
     # Calculate journey times
     coast_distance = distance - (2 * (0.5 * initial_acceleration * time_to_velocity**2))
     coast_time = coast_distance / target_velocity
     
     total_coordinate_time = coast_time + (2 * time_to_velocity)
-    total_proper_time = coast_time/gamma + (2 * time_to_velocity/gamma)
-    
-    return {
-        'acceleration_days': time_to_velocity / (24 * 3600),
-        'coast_years': coast_time / (365.25 * 24 * 3600),
-        'total_years': total_coordinate_time / (365.25 * 24 * 3600),
-        'ship_years': total_proper_time / (365.25 * 24 * 3600),
-        'fuel_mass_tons': total_fuel_mass / 1000,
+    total_proper_time = total_coordinate_time / CRUISE_GAMMA
+    
+    journey = {
+        'acceleration_days': time_to_velocity * _INV_DAY_SECONDS,
+        'coast_years': coast_time * _INV_YEAR_SECONDS,
+        'total_years': total_coordinate_time * _INV_YEAR_SECONDS,
+        'ship_years': total_proper_time * _INV_YEAR_SECONDS,
+        'fuel_mass_tons': total_fuel_mass * _INV_TON,
         'mass_ratio': mass_ratio,
-        'peak_velocity_c': target_velocity / C,
-        'gamma': gamma,
+        'peak_velocity_c': CRUISE_BETA,
+        'gamma': CRUISE_GAMMA,
         'power_output_W': drive.total_power,
         'theoretical_power_W': drive.theoretical_power,
-        'mass_flow_kg_s': drive.mass_flow_rate
+        'mass_flow_kg_s': mass_flow
     }
+    if sweep_shape == ():
+        return {name: float(value) for name, value in journey.items()}
+    return {name: np.array(np.broadcast_to(value, sweep_shape)) for name, value in journey.items()}
+
+# Lower bounds of each unit above GW, and the (divisor, suffix) per bucket
+_POWER_THRESHOLDS = (1e12, 1e15)
+_POWER_UNITS = ((1e9, 'GW'), (1e12, 'TW'), (1e15, 'PW'))
 
 def format_power(watts: float) -> str:
     """Format power in appropriate units"""
-    if watts >= 1e15:
-        return f"{watts/1e15:.1f} PW"
-    elif watts >= 1e12:
-        return f"{watts/1e12:.1f} TW"
-    else:
-        return f"{watts/1e9:.1f} GW"
+    # bisect would place NaN in the last bucket; keep it in GW as before
+    idx = 0 if math.isnan(watts) else bisect.bisect_right(_POWER_THRESHOLDS, watts)
+    divisor, suffix = _POWER_UNITS[idx]
+    return f"{watts/divisor:.1f} {suffix}"
 
-def save_to_csv(results: Dict, filename: str = None):
+def save_to_csv(results: Dict, filename: str = None, timestamp: str = None):
     """Save results to CSV file"""
-    if not os.path.exists('exports'):
-        os.makedirs('exports')
+    os.makedirs('exports', exist_ok=True)
     
     if filename is None:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'exports/nauvoo_efficiency_{timestamp}.csv'
     else:
         filename = f'exports/{filename}'
     
-    with open(filename, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header
-        writer.writerow(['Efficiency Analysis for Nauvoo Drive'])
-        writer.writerow([])
-        
-        # Write common parameters
-        writer.writerow(['Common Parameters'])
-        writer.writerow(['Parameter', 'Value'])
-        writer.writerow(['Total Thrust (MN)', f"{results['base_thrust']/1e6:.1f}"])
-        writer.writerow(['Exhaust Velocity (c)', f"{results['exhaust_vel']/C:.3f}"])
-        writer.writerow(['Dry Mass (tons)', f"{results['dry_mass']/1000:.0f}"])
-        writer.writerow([])
+    # Every cell is preformatted text, so the writer does no number conversion
+    rows = [
+        # Header
+        ('Efficiency Analysis for Nauvoo Drive',),
+        (),
         
-        # Write efficiency comparison
-        writer.writerow(['Efficiency Comparison'])
-        writer.writerow(['Parameter', '0.65% (Current)', '0.8% (Improved)', '20% (Theoretical)'])
-        
-        for param in ['mass_flow_kg_s', 'fuel_mass_tons', 'power_output_W', 'theoretical_power_W']:
-            writer.writerow([
-                param.replace('_', ' ').title(),
-                f"{results['0.0065'][param]:.1f}",
-                f"{results['0.008'][param]:.1f}",
-                f"{results['0.2'][param]:.1f}"
-            ])
+        # Common parameters
+        ('Common Parameters',),
+        ('Parameter', 'Value'),
+        ('Total Thrust (MN)', f"{results['base_thrust']/1e6:.1f}"),
+        ('Exhaust Velocity (c)', f"{results['exhaust_vel']/C:.3f}"),
+        ('Dry Mass (tons)', f"{results['dry_mass']/1000:.0f}"),
+        (),
         
+        # Efficiency comparison
+        ('Efficiency Comparison',),
+        ('Parameter', '0.65% (Current)', '0.8% (Improved)', '20% (Theoretical)')
+    ]
+    rows.extend(
+        (
+            param.replace('_', ' ').title(),
+            f"{results['0.0065'][param]:.1f}",
+            f"{results['0.008'][param]:.1f}",
+            f"{results['0.2'][param]:.1f}"
+        )
+        for param in ['mass_flow_kg_s', 'fuel_mass_tons', 'power_output_W', 'theoretical_power_W']
+    )
+    
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    with open(filename, 'wb') as f:
+        f.write(buffer.getvalue().encode('utf-8'))
+    
     print(f"\nResults saved to {filename}")
 
 def main():
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     # Base parameters
     base_thrust = 144e6  # 144 MN
     exhaust_vel = 0.08 * C
@@ -162,17 +199,20 @@ def main():
     print("\nNauvoo Drive Efficiency Analysis")
     print("===============================")
     
-    for eff_name, efficiency in efficiencies.items():
-        drive = DriveParameters(
-            thrust_per_engine=base_thrust/8,
-            num_engines=8,
-            exhaust_velocity=exhaust_vel,
-            dry_mass=dry_mass,
-            efficiency=efficiency
-        )
-        
-        # Calculate for Tau Ceti (11.9 ly)
-        journey = calculate_journey_parameters(drive, 11.9)
+    # Sweep all efficiencies in one call
+    drive = DriveParameters(
+        thrust_per_engine=base_thrust/8,
+        num_engines=8,
+        exhaust_velocity=exhaust_vel,
+        dry_mass=dry_mass,
+        efficiency=np.array(list(efficiencies.values()))
+    )
+    
+    # Calculate for Tau Ceti (11.9 ly)
+    sweep = calculate_journey_parameters(drive, 11.9)
+    
+    for idx, (eff_name, efficiency) in enumerate(efficiencies.items()):
+        journey = {param: values[idx] for param, values in sweep.items()}
         results[eff_name] = journey
         
         print(f"\nEfficiency: {efficiency*100:.1f}%")
@@ -183,7 +223,7 @@ def main():
         print(f"  Earth time: {journey['total_years']:.1f} years")
         print(f"  Ship time: {journey['ship_years']:.1f} years")
     
-    save_to_csv(results)
+    save_to_csv(results, timestamp=timestamp)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file